@@ -0,0 +1,44 @@
+"""
+Scheduling priorities for parallel executors
+"""
+import networkx as nx
+
+
+def critical_path(dag):
+    """
+    Compute a priority for each task in the DAG: the number of edges in the
+    longest path that goes through it (longest path from a root to the task
+    plus the longest path from the task to a final task). Tasks in the
+    critical path have the highest priority, scheduling them first prevents
+    workers from idling while waiting for a long chain of tasks to finish
+
+    Returns
+    -------
+    dict
+        A task name -> priority mapping
+
+    Notes
+    -----
+    Executors only use the priority to pick among tasks that are ready at
+    the same time. ``Parallel`` submits every ready task right away and
+    ``ProcessPoolExecutor`` runs submissions in FIFO order, so a task that
+    becomes ready later still waits behind tasks already submitted
+    """
+    order = list(nx.topological_sort(dag._G))
+
+    # longest path (number of edges) from any root node to each task
+    top = {}
+
+    for name in order:
+        top[name] = max((top[up] + 1 for up in dag._G.predecessors(name)),
+                        default=0)
+
+    # longest path (number of edges) from each task to any final node
+    bottom = {}
+
+    for name in reversed(order):
+        bottom[name] = max(
+            (bottom[down] + 1 for down in dag._G.successors(name)),
+            default=0)
+
+    return {name: top[name] + bottom[name] for name in order}
@@ -14,6 +14,7 @@ from ploomber.executors.abc import Executor
 from ploomber.exceptions import DAGBuildError
 from ploomber.messagecollector import (BuildExceptionsCollector, Message)
 from ploomber.executors import _format
+from ploomber.executors._priority import critical_path
 from multiprocessing import get_context, get_start_method
 from ploomber.io import pretty_print
 
@@ -136,6 +137,7 @@ class Parallel(Executor):
         done = []
         started = []
         set_all = set(dag)
+        priority = critical_path(dag)
         future_mapping = {}
 
         # there might be up-to-date tasks, add them to done
@@ -208,16 +210,19 @@ class Parallel(Executor):
                 elif task.exec_status == TaskStatus.BrokenProcessPool:
                     raise StopIteration
 
-            # iterate over tasks to find which is ready for execution
-            for task in dag.values():
-                # ignore tasks that are already started, I should probably add
-                # an executing status but that cannot exist in the task itself,
-                # maybe in the manaer?
-                if (task.exec_status in {
-                        TaskStatus.WaitingExecution, TaskStatus.WaitingDownload
-                } and task not in started):
-                    return task
-                # there might be some up-to-date tasks, add them
+            # find which tasks are ready for execution; ignore tasks that
+            # are already started, I should probably add an executing status
+            # but that cannot exist in the task itself, maybe in the manaer?
+            ready = [
+                task for task in dag.values() if task.exec_status in
+                {TaskStatus.WaitingExecution, TaskStatus.WaitingDownload}
+                and task not in started
+            ]
+
+            # submit tasks in the critical path first, so their downstream
+            # dependencies are unlocked as early as possible
+            if ready:
+                return max(ready, key=lambda task: priority[task.name])
 
             set_done = set([t.name for t in done])
 
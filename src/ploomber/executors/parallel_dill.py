@@ -14,6 +14,7 @@ from ploomber.executors.abc import Executor
 from ploomber.exceptions import DAGBuildError
 from ploomber.messagecollector import BuildExceptionsCollector, Message
 from ploomber.executors import _format
+from ploomber.executors._priority import critical_path
 from ploomber.io import pretty_print
 from ploomber.util import requires
 
@@ -90,6 +91,7 @@ class ParallelDill(Executor):
         started = []
         failed = []
         set_all = set(dag)
+        priority = critical_path(dag)
         future_mapping = {}
         self._dag = dag
 
@@ -172,16 +174,19 @@ class ParallelDill(Executor):
                 elif task.exec_status == TaskStatus.BrokenProcessPool:
                     raise StopIteration
 
-            # iterate over tasks to find which is ready for execution
-            for task in dag.values():
-                # ignore tasks that are already started, I should probably add
-                # an executing status but that cannot exist in the task itself,
-                # maybe in the manaer?
-                if (task.exec_status in {
-                        TaskStatus.WaitingExecution, TaskStatus.WaitingDownload
-                } and task not in started):
-                    return task
-                # there might be some up-to-date tasks, add them
+            # find which tasks are ready for execution; ignore tasks that
+            # are already started, I should probably add an executing status
+            # but that cannot exist in the task itself, maybe in the manaer?
+            ready = [
+                task for task in dag.values() if task.exec_status in
+                {TaskStatus.WaitingExecution, TaskStatus.WaitingDownload}
+                and task not in started
+            ]
+
+            # submit tasks in the critical path first, so their downstream
+            # dependencies are unlocked as early as possible
+            if ready:
+                return max(ready, key=lambda task: priority[task.name])
 
             set_done = set([t.name for t in done])
 
@@ -4,7 +4,7 @@ import contextlib
 import inspect
 import os
 import sys
-from functools import partial
+from functools import partial, lru_cache
 
 import debuglater
 import nbconvert
@@ -176,8 +176,16 @@ def _capture_execute(function, globals_, **kwargs):
 def _get_body_statements(function):
     """Extract function statements
     """
-    source = inspect.getsource(function)
+    return list(_parse_body_statements(inspect.getsource(function)))
 
+
+# cache using the source code as key (and not the function), so the result
+# is still valid if the function is re-defined and we don't parse the same
+# function each time a task runs
+@lru_cache(maxsize=256)
+def _parse_body_statements(source):
+    """Extract function statements from the function's source code
+    """
     # get first non empty child, the function is usually the first one. one
     # case where it's not is when the function is indented (e.g. a function
     # inside a function)
@@ -194,7 +202,7 @@ def _get_body_statements(function):
         st for st in fn.children[-1].children if st.get_code().strip()
     ]
 
-    return _deindent(body_elements)
+    return tuple(_deindent(body_elements))
 
 
 def _deindent(body_elements):
@@ -223,11 +231,15 @@ def _to_html(path, nb):
     Path(path).write_text(html, encoding='utf-8')
 
 
+_TAG = re.compile(r'# tag=([\w-]+)')
+
+
+@lru_cache(maxsize=256)
 def _parse_tag(source):
     """Given a chunk of code (str), extract the tag, if any
     """
     tag_maybe = source.strip().splitlines()[0]
-    result = re.match(r'# tag=([\w-]+)', tag_maybe)
+    result = _TAG.match(tag_maybe)
 
     if result:
         return result.group(1)
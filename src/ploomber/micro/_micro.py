@@ -1,3 +1,4 @@
+import pickle
 from functools import wraps
 from inspect import signature
 from itertools import chain
@@ -74,9 +75,13 @@ def unserializer(extension_mapping=None,
     return _unserializer
 
 
-@serializer(fallback=True)
+@serializer()
 def _serializer(obj, product):
-    pass
+    # the pickle fallback uses the default protocol, use the highest one
+    # instead (protocol 5 writes large buffers such as numpy arrays straight
+    # to the file without copying them into the pickle stream)
+    with open(product, 'wb') as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 @unserializer(fallback=True)
@@ -151,11 +156,9 @@ def _get_upstream(fn):
         return set(signature(fn).parameters) - {'input_data'}
 
 
-def _make_task(callable_, dag, params, output, call_with_args, suffix=None):
-    """Generate a Ploomber task from a function
+def _wrap_callable(callable_, call_with_args):
+    """Wrap the function (if needed) so it can be used as a Ploomber task
     """
-    name = callable_.__name__
-    name = name if suffix is None else f"{name}-{suffix}"
     params_signature = set(signature(callable_).parameters)
 
     if len(params_signature) and params_signature != {"input_data"}:
@@ -163,6 +166,16 @@ def _make_task(callable_, dag, params, output, call_with_args, suffix=None):
         callable_ = _signature_wrapper(callable_,
                                        call_with_args=call_with_args)
 
+    return callable_
+
+
+def _make_task(callable_, dag, params, output, suffix=None):
+    """Generate a Ploomber task from a function (already passed through
+    _wrap_callable)
+    """
+    name = callable_.__name__
+    name = name if suffix is None else f"{name}-{suffix}"
+
     capture_ = hasattr(callable_, '__ploomber_capture__')
     CLASS = (_PythonCallableNoValidation
              if not capture_ else _CapturedPythonCallable)
@@ -240,12 +253,20 @@ def dag_from_functions(functions,
         # functions might be defined in the __main__ module
         dag.executor = Serial(build_in_subprocess=False)
 
+    upstream_all = dict()
+
     for callable_ in functions:
         if callable_.__name__ in params:
             params_task = params[callable_.__name__]
         else:
             params_task = dict()
 
+        # wrap and inspect the function once, all tasks generated by @grid
+        # share the same callable and upstream dependencies
+        callable_ = _wrap_callable(
+            callable_, call_with_args=callable_.__name__ in dependencies)
+        upstream = _get_upstream(callable_)
+
         # if decorated, call with grid
         if hasattr(callable_, "__ploomber_grid__"):
 
@@ -253,7 +274,7 @@ def dag_from_functions(functions,
                     chain(*(ParamGrid(grid).product()
                             for grid in callable_.__ploomber_grid__))):
 
-                _make_task(
+                task = _make_task(
                     callable_,
                     dag=dag,
                     params={
@@ -261,25 +282,25 @@ def dag_from_functions(functions,
                         **items
                     },
                     output=output,
-                    call_with_args=callable_.__name__ in dependencies,
                     suffix=i,
                 )
+                upstream_all[task.name] = upstream
         else:
 
-            _make_task(
+            task = _make_task(
                 callable_,
                 dag=dag,
                 params=params_task,
                 output=output,
-                call_with_args=callable_.__name__ in dependencies,
             )
+            upstream_all[task.name] = upstream
 
-    for name in dag._iter():
+    # NOTE: do not use dag[name].source.primitive to get the upstream
+    # dependencies, if hot_reload is enabled, it reloads the module every time
+    for name, upstream in upstream_all.items():
         # check if there are manually declared dependencies
         if name in dependencies:
             upstream = dependencies[name]
-        else:
-            upstream = _get_upstream(dag[name].source.primitive)
 
         for up in upstream:
             dag[name].set_upstream(dag[up])
@@ -161,6 +161,31 @@ def tmp_directory_local(tmp_path):
     os.chdir(old)
 
 
+@pytest.fixture
+def tmp_directory_in_memory():
+    """
+    Pretty much the same as tmp_directory, but it creates the directory in
+    /dev/shm (a tmpfs mount) when available, so tests that write and read
+    many small files don't hit the disk. Falls back to the default temporary
+    location (e.g., on macOS and Windows). Do not use it for tests that
+    write large files, since /dev/shm is usually small in containers
+    """
+    shm = Path('/dev/shm')
+    in_memory = shm.is_dir() and os.access(shm, os.W_OK)
+
+    old = os.getcwd()
+    tmp = tempfile.mkdtemp(prefix='ploomber-test-',
+                           dir=str(shm) if in_memory else None)
+    os.chdir(tmp)
+
+    yield tmp
+
+    os.chdir(old)
+
+    # clean up since files in /dev/shm take up memory
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
 @pytest.fixture()
 def sqlite_client_and_tmp_dir():
     """
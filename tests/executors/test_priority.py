@@ -0,0 +1,24 @@
+from ploomber import DAG
+from ploomber.products import File
+from ploomber.tasks import PythonCallable
+from ploomber.executors._priority import critical_path
+
+
+def fn(product, upstream=None):
+    pass
+
+
+def test_critical_path():
+    dag = DAG()
+
+    a = PythonCallable(fn, File('a.txt'), dag, 'a')
+    b = PythonCallable(fn, File('b.txt'), dag, 'b')
+    c = PythonCallable(fn, File('c.txt'), dag, 'c')
+    d = PythonCallable(fn, File('d.txt'), dag, 'd')
+    PythonCallable(fn, File('e.txt'), dag, 'e')
+
+    # a -> b -> c is the longest chain, d -> c and e are shorter
+    a >> b >> c
+    d >> c
+
+    assert critical_path(dag) == {'a': 2, 'b': 2, 'c': 2, 'd': 1, 'e': 0}
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from ploomber import DAG
+from ploomber.executors import Parallel, ParallelDill
 from ploomber.products import File
 from ploomber.tasks import PythonCallable
 
@@ -18,6 +19,17 @@ def touch(upstream, product):
     Path(str(product)).touch()
 
 
+def record_root(product):
+    with open('order.txt', 'a') as f:
+        f.write(Path(str(product)).stem + '\n')
+
+    Path(str(product)).touch()
+
+
+def record(upstream, product):
+    record_root(product)
+
+
 def failing(product):
     raise Exception('Bad things happened')
 
@@ -33,3 +45,43 @@ def test_parallel_execution(tmp_directory):
     (a1 + a2) >> b >> c
 
     dag.build()
+
+
+def _dag_with_critical_path(executor):
+    dag = DAG('dag', executor=executor)
+
+    # e is added first so it comes first in the DAG, a -> b -> c is the
+    # critical path
+    PythonCallable(record_root, File('e.txt'), dag, 'e')
+    a = PythonCallable(record_root, File('a.txt'), dag, 'a')
+    b = PythonCallable(record, File('b.txt'), dag, 'b')
+    c = PythonCallable(record, File('c.txt'), dag, 'c')
+
+    a >> b >> c
+
+    return dag
+
+
+def _execution_order():
+    return Path('order.txt').read_text().splitlines()
+
+
+def test_parallel_dill_runs_critical_path_first(tmp_directory):
+    dag = _dag_with_critical_path(ParallelDill(processes=1))
+
+    dag.build()
+
+    # ParallelDill waits for a free process before picking the next task, so
+    # b is ready (and picked before e) once a finishes
+    assert _execution_order() == ['a', 'b', 'c', 'e']
+
+
+def test_parallel_runs_critical_path_first(tmp_directory):
+    dag = _dag_with_critical_path(Parallel(processes=1))
+
+    dag.build()
+
+    # Parallel submits every ready task right away, so only the first
+    # submission (a and e are both ready) follows the priority
+    assert _execution_order()[0] == 'a'
+    assert sorted(_execution_order()) == ['a', 'b', 'c', 'e']
@@ -1,9 +1,9 @@
 import pickle
+import importlib
 from pathlib import Path
 from unittest.mock import Mock
 
 import pandas as pd
-import matplotlib.pyplot as plt
 import nbformat
 import pytest
 
@@ -13,6 +13,30 @@ from ploomber import micro
 from ploomber.micro import _capture
 
 
+class _LazyPyplot:
+    """
+    Imports matplotlib.pyplot the first time it's used. Captured functions
+    look up plt in this module's globals, so we bind it here instead of
+    importing it inside fixtures. Note that PloomberShell imports pyplot when
+    it starts, so this only avoids the import if no capture test runs
+    """
+
+    def __getattr__(self, name):
+        # do not import when looking up special methods (e.g., pickle)
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        return getattr(importlib.import_module('matplotlib.pyplot'), name)
+
+
+plt = _LazyPyplot()
+
+
+def _load(*path):
+    with open(Path(*path), 'rb') as f:
+        return pickle.load(f)
+
+
 def ones(input_data):
     return pd.Series(input_data)
 
@@ -49,7 +73,7 @@ def plot_ones(ones):
 
 
 @pytest.mark.parametrize('parallel', [True, False])
-def test_inline(tmp_directory, parallel):
+def test_inline(tmp_directory_in_memory, parallel):
     dag = micro.dag_from_functions(
         [ones, twos, both],
         params={"ones": {
@@ -61,9 +85,11 @@ def test_inline(tmp_directory, parallel):
 
     dag.build()
 
-    ones_ = pickle.loads(Path('cache', 'ones').read_bytes()).to_dict()
-    twos_ = pickle.loads(Path('cache', 'twos').read_bytes()).to_dict()
-    both_ = pickle.loads(Path('cache', 'both').read_bytes()).to_dict()
+    # read the files directly to check outputs are stored as pickles, other
+    # tests use task.load()
+    ones_ = _load('cache', 'ones').to_dict()
+    twos_ = _load('cache', 'twos').to_dict()
+    both_ = _load('cache', 'both').to_dict()
 
     assert ones_ == {0: 1, 1: 1, 2: 1}
     assert twos_ == {0: 2, 1: 2, 2: 2}
@@ -76,7 +102,7 @@ def test_inline(tmp_directory, parallel):
                      reason='Gets stuck on GitHub Actions on Python 3.9')),
     False,
 ])
-def test_inline_with_manual_dependencies(tmp_directory, parallel):
+def test_inline_with_manual_dependencies(tmp_directory_in_memory, parallel):
     dag = micro.dag_from_functions(
         [ones, twos, multiply],
         output="cache",
@@ -89,16 +115,16 @@ def test_inline_with_manual_dependencies(tmp_directory, parallel):
 
     dag.build()
 
-    ones_ = pickle.loads(Path('cache', 'ones').read_bytes()).to_dict()
-    twos_ = pickle.loads(Path('cache', 'twos').read_bytes()).to_dict()
-    multiply_ = pickle.loads(Path('cache', 'multiply').read_bytes()).to_dict()
+    ones_ = dag['ones'].load().to_dict()
+    twos_ = dag['twos'].load().to_dict()
+    multiply_ = dag['multiply'].load().to_dict()
 
     assert ones_ == {0: 1, 1: 1, 2: 1}
     assert twos_ == {0: 2, 1: 2, 2: 2}
     assert multiply_ == {0: 2, 1: 2, 2: 2}
 
 
-def test_inline_grid(tmp_directory):
+def test_inline_grid(tmp_directory_in_memory):
     dag = micro.dag_from_functions([ones, add],
                                    params={"ones": {
                                        "input_data": [1] * 3
@@ -107,11 +133,11 @@ def test_inline_grid(tmp_directory):
 
     dag.build()
 
-    ones_ = pickle.loads(Path('cache', 'ones').read_bytes()).to_dict()
-    add_0 = pickle.loads(Path('cache', 'add-0').read_bytes()).to_dict()
-    add_1 = pickle.loads(Path('cache', 'add-1').read_bytes()).to_dict()
-    add_2 = pickle.loads(Path('cache', 'add-2').read_bytes()).to_dict()
-    add_3 = pickle.loads(Path('cache', 'add-3').read_bytes()).to_dict()
+    ones_ = dag['ones'].load().to_dict()
+    add_0 = dag['add-0'].load().to_dict()
+    add_1 = dag['add-1'].load().to_dict()
+    add_2 = dag['add-2'].load().to_dict()
+    add_3 = dag['add-3'].load().to_dict()
 
     assert ones_ == {0: 1, 1: 1, 2: 1}
     assert add_0 == {0: 5, 1: 5, 2: 5}
@@ -120,7 +146,7 @@ def test_inline_grid(tmp_directory):
     assert add_3 == {0: 7, 1: 7, 2: 7}
 
 
-def test_inline_grid_multiple(tmp_directory):
+def test_inline_grid_multiple(tmp_directory_in_memory):
     dag = micro.dag_from_functions([ones, add_many],
                                    params={"ones": {
                                        "input_data": [1] * 3
@@ -129,10 +155,10 @@ def test_inline_grid_multiple(tmp_directory):
 
     dag.build()
 
-    ones_ = pickle.loads(Path('cache', 'ones').read_bytes()).to_dict()
+    ones_ = dag['ones'].load().to_dict()
 
     add_many_ = [
-        pickle.loads(Path('cache', f'add_many-{i}').read_bytes()).to_dict()
+        dag[f'add_many-{i}'].load().to_dict()
         for i in range(8)
     ]
 
@@ -174,7 +200,7 @@ def test_inline_grid_multiple(tmp_directory):
 
 @pytest.mark.parametrize('parallel', [True, False])
 @pytest.mark.parametrize('debug', [None, 'now', 'later'])
-def test_capture(tmp_directory, parallel, debug):
+def test_capture(tmp_directory_in_memory, parallel, debug):
     dag = micro.dag_from_functions(
         [ones, plot_ones],
         params={"ones": {
@@ -186,8 +212,8 @@ def test_capture(tmp_directory, parallel, debug):
 
     dag.build(debug=debug)
 
-    ones_ = pickle.loads(Path('cache', 'ones').read_bytes()).to_dict()
-    plot_ones_ = pickle.loads(Path('cache', 'plot_ones').read_bytes())
+    ones_ = dag['ones'].load().to_dict()
+    plot_ones_ = dag['plot_ones'].load(key='return')
 
     assert ones_ == {0: 1, 1: 1, 2: 1}
     assert plot_ones_ == 1
@@ -257,7 +283,7 @@ def test_capture_debug_later(tmp_directory, monkeypatch):
     assert Path('number.dump').is_file()
 
 
-def test_capture_that_depends_on_capture(tmp_directory):
+def test_capture_that_depends_on_capture(tmp_directory_in_memory):
 
     @micro.capture
     def first():
@@ -284,7 +310,7 @@ def test_error_when_returning_non_variable_and_capture(tmp_directory):
     dag.build(debug='now')
 
 
-def test_root_node_with_no_arguments(tmp_directory):
+def test_root_node_with_no_arguments(tmp_directory_in_memory):
 
     def root():
         return 1
@@ -295,8 +321,8 @@ def test_root_node_with_no_arguments(tmp_directory):
     dag = micro.dag_from_functions([root, add], hot_reload=False)
     dag.build()
 
-    root_ = pickle.loads(Path('output', 'root').read_bytes())
-    add_ = pickle.loads(Path('output', 'add').read_bytes())
+    root_ = dag['root'].load()
+    add_ = dag['add'].load()
 
     assert root_ == 1
     assert add_ == 2
@@ -324,7 +350,7 @@ def test_decorated_root_with_input_data(tmp_directory):
 
 # TODO: also try with grid
 # NOTE: this is failing because it's trying to unpickle the html
-def test_decorated_root_without_arguments(tmp_directory):
+def test_decorated_root_without_arguments(tmp_directory_in_memory):
 
     @micro.capture
     def root():
@@ -337,8 +363,8 @@ def test_decorated_root_without_arguments(tmp_directory):
     dag = micro.dag_from_functions([root, add], hot_reload=False)
     dag.build()
 
-    root_ = pickle.loads(Path('output', 'root').read_bytes())
-    add_ = pickle.loads(Path('output', 'add').read_bytes())
+    root_ = dag['root'].load(key='return')
+    add_ = dag['add'].load()
 
     assert root_ == 1
     assert add_ == 2
@@ -365,7 +391,7 @@ def fit(get, model):
     return model
 
 
-def test_decorated_with_capture_and_grid(tmp_directory):
+def test_decorated_with_capture_and_grid(tmp_directory_in_memory):
     dag = micro.dag_from_functions([get, fit])
     dag.build()
 
@@ -417,6 +443,17 @@ def test_deindents_statements(fn, expected):
     assert _capture._get_body_statements(fn) == expected
 
 
+def test_get_body_statements_parses_source_once():
+    _capture._parse_body_statements.cache_clear()
+
+    first = _capture._get_body_statements(simple)
+    second = _capture._get_body_statements(simple)
+    info = _capture._parse_body_statements.cache_info()
+
+    assert first == second == ['x = 1', 'y = 2', 'return x, y']
+    assert (info.hits, info.misses) == (1, 1)
+
+
 @pytest.mark.parametrize('source, expected', [
     ['# tag=plot', 'plot'],
     ['# tag=cool_plot', 'cool_plot'],
@@ -424,6 +461,9 @@ def test_deindents_statements(fn, expected):
     ['# tag=plot0', 'plot0'],
     ['# tag=0plot', '0plot'],
     ['\n    # tag=plot\n    plot.confusion_matrix(y_test, y_pred)\n', 'plot'],
+    ['# tag=plot.png', 'plot'],
+    ['# tag=', None],
+    ['x = 1', None],
 ])
 def test_parse_tag(source, expected):
     assert _capture._parse_tag(source) == expected